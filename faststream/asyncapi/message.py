@@ -1,11 +1,17 @@
+from copy import deepcopy
 from inspect import isclass
 from typing import Any, Dict, Optional, Sequence, Type, overload
+from weakref import WeakKeyDictionary
 
 from fast_depends.core import CallModel
 from pydantic import BaseModel
 
 from faststream._compat import PYDANTIC_V2, get_model_fields, model_schema
 
+_model_schema_cache: "WeakKeyDictionary[Type[BaseModel], Dict[str, Any]]" = (
+    WeakKeyDictionary()
+)
+
 
 def parse_handler_params(call: CallModel[Any, Any], prefix: str = "") -> Dict[str, Any]:
     """Parses the handler parameters.
@@ -168,7 +174,13 @@ def get_model_schema(
     if model is None:
         model = call
 
-    body: Dict[str, Any] = model_schema(model)
+    cached = _model_schema_cache.get(model)
+    if cached is None:
+        _model_schema_cache[model] = cached = model_schema(model)
+
+    # the generated schema is patched in place below, so every caller
+    # has to work with its own copy of the cached version
+    body: Dict[str, Any] = deepcopy(cached)
     body["properties"] = body.get("properties", {})
     for i in exclude:
         body["properties"].pop(i, None)
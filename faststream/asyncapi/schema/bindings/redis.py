@@ -2,6 +2,8 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel
 
+from faststream._compat import PYDANTIC_V2
+
 
 class ServerBinding(BaseModel):
     """A class to represent a server binding.
@@ -13,6 +15,14 @@ class ServerBinding(BaseModel):
 
     bindingVersion: str = "custom"
 
+    if PYDANTIC_V2:
+        model_config = {"frozen": True}
+
+    else:
+
+        class Config:
+            frozen = True
+
 
 class ChannelBinding(BaseModel):
     """A class to represent channel binding.
@@ -30,6 +40,14 @@ class ChannelBinding(BaseModel):
     consumer_name: Optional[str] = None
     bindingVersion: str = "custom"
 
+    if PYDANTIC_V2:
+        model_config = {"frozen": True}
+
+    else:
+
+        class Config:
+            frozen = True
+
 
 class OperationBinding(BaseModel):
     """A class to represent an operation binding.
@@ -42,3 +60,11 @@ class OperationBinding(BaseModel):
 
     replyTo: Optional[Dict[str, Any]] = None
     bindingVersion: str = "custom"
+
+    if PYDANTIC_V2:
+        model_config = {"frozen": True}
+
+    else:
+
+        class Config:
+            frozen = True
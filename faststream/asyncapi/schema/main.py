@@ -2,7 +2,7 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel
 
-from faststream._compat import PYDANTIC_V2, model_to_json, model_to_jsonable
+from faststream._compat import PYDANTIC_V2, json_loads, model_to_json
 from faststream.asyncapi.schema.channels import Channel
 from faststream.asyncapi.schema.info import Info
 from faststream.asyncapi.schema.message import Message
@@ -99,11 +99,7 @@ class Schema(BaseModel):
 
     def to_jsonable(self) -> Any:
         """Convert the schema to a JSON-serializable object."""
-        return model_to_jsonable(
-            self,
-            by_alias=True,
-            exclude_none=True,
-        )
+        return json_loads(self.to_json())
 
     def to_json(self) -> str:
         """Convert the schema to a JSON string."""
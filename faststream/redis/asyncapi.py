@@ -1,5 +1,7 @@
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
+from faststream._compat import model_copy
 from faststream.asyncapi.schema import (
     Channel,
     ChannelBinding,
@@ -12,10 +14,32 @@ from faststream.asyncapi.utils import resolve_payloads
 from faststream.redis.handler import LogicRedisHandler
 from faststream.redis.publisher import LogicPublisher
 
+CORRELATION_ID = CorrelationId(location="$message.header#/correlation_id")
+
+
+@lru_cache(maxsize=None)
+def _channel_binding(
+    channel: str,
+    method: str,
+    group_name: Optional[str] = None,
+    consumer_name: Optional[str] = None,
+) -> ChannelBinding:
+    """Build (or reuse) the binding for a channel/method pair."""
+    return ChannelBinding(
+        redis=redis.ChannelBinding(
+            channel=channel,
+            group_name=group_name,
+            consumer_name=consumer_name,
+            method=method,
+        )
+    )
+
 
 class Handler(LogicRedisHandler):
     """A class to represent a Redis handler."""
 
+    _schema_cache: Optional[Tuple[Tuple[Any, ...], Channel]] = None
+
     @property
     def name(self) -> str:
         return self._title or f"{self.channel_name}:{self.call_name}"
@@ -24,84 +48,123 @@ class Handler(LogicRedisHandler):
         if not self.include_in_schema:
             return {}
 
-        payloads = self.get_payloads()
+        key = self._schema_key()
+
+        cached = self._schema_cache
+        if cached is None or cached[0] != key:
+            cached = self._schema_cache = (key, self._build_channel())
+
+        # `get_app_schema` mutates the generated models, so share only copies
+        return {self.name: model_copy(cached[1], deep=True)}
+
+    def _schema_key(self) -> Tuple[Any, ...]:
+        """Get a hashable view of the schema-related handler state."""
+        return (
+            self._title,
+            self._description,
+            self.channel_name,
+            self.call_name,
+            self.list_sub is not None,
+            getattr(self.channel, "pattern", None),
+            getattr(self.stream_sub, "group", None),
+            self.stream_sub is not None,
+            tuple(id(h) for h, *_ in self.calls),
+        )
 
-        method = None
+    @property
+    def _method(self) -> str:
+        """Get the Redis method the handler subscription relies on."""
         if self.list_sub is not None:
-            method = "lpop"
-
-        elif (ch := self.channel) is not None:
-            method = "psubscribe" if ch.pattern else "subscribe"
-
-        elif (stream := self.stream_sub) is not None:
-            method = "xreadgroup" if stream.group else "xread"
-
-        else:
-            raise AssertionError("unreachable")
-
-        return {
-            self.name: Channel(
-                description=self.description,
-                subscribe=Operation(
-                    message=Message(
-                        title=f"{self.name}:Message",
-                        payload=resolve_payloads(payloads),
-                        correlationId=CorrelationId(
-                            location="$message.header#/correlation_id"
-                        ),
-                    ),
-                ),
-                bindings=ChannelBinding(
-                    redis=redis.ChannelBinding(
-                        channel=self.channel_name,
-                        group_name=getattr(self.stream_sub, "group", None),
-                        consumer_name=getattr(self.stream_sub, "consumer", None),
-                        method=method,
-                    )
+            return "lpop"
+
+        if (ch := self.channel) is not None:
+            return "psubscribe" if ch.pattern else "subscribe"
+
+        if (stream := self.stream_sub) is not None:
+            return "xreadgroup" if stream.group else "xread"
+
+        raise AssertionError("unreachable")
+
+    def _build_channel(self) -> Channel:
+        payloads = self.get_payloads()
+
+        return Channel(
+            description=self.description,
+            subscribe=Operation(
+                message=Message(
+                    title=f"{self.name}:Message",
+                    payload=resolve_payloads(payloads),
+                    correlationId=CORRELATION_ID,
                 ),
-            )
-        }
+            ),
+            bindings=_channel_binding(
+                channel=self.channel_name,
+                method=self._method,
+                group_name=getattr(self.stream_sub, "group", None),
+                consumer_name=getattr(self.stream_sub, "consumer", None),
+            ),
+        )
 
 
 class Publisher(LogicPublisher):
     """A class to represent a Redis publisher."""
 
+    _schema_cache: Optional[Tuple[Tuple[Any, ...], Channel]] = None
+
     def schema(self) -> Dict[str, Channel]:
         if not self.include_in_schema:
             return {}
 
-        payloads = self.get_payloads()
+        key = self._schema_key()
+
+        cached = self._schema_cache
+        if cached is None or cached[0] != key:
+            cached = self._schema_cache = (key, self._build_channel())
+
+        # `get_app_schema` mutates the generated models, so share only copies
+        return {self.name: model_copy(cached[1], deep=True)}
 
-        method = None
+    def _schema_key(self) -> Tuple[Any, ...]:
+        """Get a hashable view of the schema-related publisher state."""
+        return (
+            self.title,
+            self._description,
+            self.channel_name,
+            self.list is not None,
+            self.channel is not None,
+            self.stream is not None,
+            id(self._schema),
+            tuple(id(call) for call in self.calls),
+        )
+
+    @property
+    def _method(self) -> str:
+        """Get the Redis method the publisher relies on."""
         if self.list is not None:
-            method = "rpush"
-        elif self.channel is not None:
-            method = "publish"
-        elif self.stream is not None:
-            method = "xadd"
-        else:
-            raise AssertionError("unreachable")
-
-        return {
-            self.name: Channel(
-                description=self.description,
-                publish=Operation(
-                    message=Message(
-                        title=f"{self.name}:Message",
-                        payload=resolve_payloads(payloads, "Publisher"),
-                        correlationId=CorrelationId(
-                            location="$message.header#/correlation_id"
-                        ),
-                    ),
-                ),
-                bindings=ChannelBinding(
-                    redis=redis.ChannelBinding(
-                        channel=self.channel_name,
-                        method=method,
-                    )
+            return "rpush"
+        if self.channel is not None:
+            return "publish"
+        if self.stream is not None:
+            return "xadd"
+        raise AssertionError("unreachable")
+
+    def _build_channel(self) -> Channel:
+        payloads = self.get_payloads()
+
+        return Channel(
+            description=self.description,
+            publish=Operation(
+                message=Message(
+                    title=f"{self.name}:Message",
+                    payload=resolve_payloads(payloads, "Publisher"),
+                    correlationId=CORRELATION_ID,
                 ),
-            )
-        }
+            ),
+            bindings=_channel_binding(
+                channel=self.channel_name,
+                method=self._method,
+            ),
+        )
 
     @property
     def name(self) -> str:
@@ -3,6 +3,38 @@ from faststream.asyncapi.generate import get_app_schema
 from faststream.nats import NatsBroker
 from tests.asyncapi.base.naming import NamingTestCase
 
+_EXPECTED_NATS_BASE_SCHEMA = {
+    "asyncapi": "2.6.0",
+    "defaultContentType": "application/json",
+    "info": {"title": "FastStream", "version": "0.1.0", "description": ""},
+    "servers": {
+        "development": {
+            "url": "nats://localhost:4222",
+            "protocol": "nats",
+            "protocolVersion": "custom",
+        }
+    },
+    "channels": {
+        "test:Handle": {
+            "servers": ["development"],
+            "bindings": {"nats": {"subject": "test", "bindingVersion": "custom"}},
+            "subscribe": {
+                "message": {"$ref": "#/components/messages/test:Handle:Message"}
+            },
+        }
+    },
+    "components": {
+        "messages": {
+            "test:Handle:Message": {
+                "title": "test:Handle:Message",
+                "correlationId": {"location": "$message.header#/correlation_id"},
+                "payload": {"$ref": "#/components/schemas/EmptyPayload"},
+            }
+        },
+        "schemas": {"EmptyPayload": {"title": "EmptyPayload", "type": "null"}},
+    },
+}
+
 
 class TestNaming(NamingTestCase):  # noqa: D101
     broker_class = NatsBroker
@@ -16,38 +48,4 @@ class TestNaming(NamingTestCase):  # noqa: D101
 
         schema = get_app_schema(FastStream(broker)).to_jsonable()
 
-        assert schema == {
-            "asyncapi": "2.6.0",
-            "defaultContentType": "application/json",
-            "info": {"title": "FastStream", "version": "0.1.0", "description": ""},
-            "servers": {
-                "development": {
-                    "url": "nats://localhost:4222",
-                    "protocol": "nats",
-                    "protocolVersion": "custom",
-                }
-            },
-            "channels": {
-                "test:Handle": {
-                    "servers": ["development"],
-                    "bindings": {
-                        "nats": {"subject": "test", "bindingVersion": "custom"}
-                    },
-                    "subscribe": {
-                        "message": {"$ref": "#/components/messages/test:Handle:Message"}
-                    },
-                }
-            },
-            "components": {
-                "messages": {
-                    "test:Handle:Message": {
-                        "title": "test:Handle:Message",
-                        "correlationId": {
-                            "location": "$message.header#/correlation_id"
-                        },
-                        "payload": {"$ref": "#/components/schemas/EmptyPayload"},
-                    }
-                },
-                "schemas": {"EmptyPayload": {"title": "EmptyPayload", "type": "null"}},
-            },
-        }
+        assert schema == _EXPECTED_NATS_BASE_SCHEMA
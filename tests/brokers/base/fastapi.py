@@ -13,53 +13,57 @@ from faststream.broker.core.asynchronous import BrokerAsyncUsecase
 from faststream.broker.fastapi.context import Context
 from faststream.broker.fastapi.router import StreamRouter
 from faststream.types import AnyCallable
+from tests.tools import wait_all
 
 Broker = TypeVar("Broker", bound=BrokerAsyncUsecase)
 
 
+def build_router(
+    router_class: Type[StreamRouter[BrokerAsyncUsecase]],
+    queue: str,
+    handler: AnyCallable,
+) -> StreamRouter[BrokerAsyncUsecase]:
+    """Build a fresh router with `handler` subscribed to `queue`."""
+    router = router_class()
+    router.subscriber(queue)(handler)
+    return router
+
+
 @pytest.mark.asyncio()
 class FastAPITestcase:  # noqa: D101
     router_class: Type[StreamRouter[BrokerAsyncUsecase]]
 
     async def test_base_real(self, mock: Mock, queue: str, event: asyncio.Event):
-        router = self.router_class()
-
-        @router.subscriber(queue)
         async def hello(msg):
             event.set()
             return mock(msg)
 
+        router = build_router(self.router_class, queue, hello)
+
         async with router.broker:
             await router.broker.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(router.broker.publish("hi", queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
+            await wait_all(
+                router.broker.publish("hi", queue),
+                event.wait(),
             )
 
         assert event.is_set()
         mock.assert_called_with("hi")
 
     async def test_context(self, mock: Mock, queue: str, event: asyncio.Event):
-        router = self.router_class()
-
         context_key = "message.headers"
 
-        @router.subscriber(queue)
         async def hello(msg=Context(context_key)):
             event.set()
             return mock(msg == context.resolve(context_key))
 
+        router = build_router(self.router_class, queue, hello)
+
         async with router.broker:
             await router.broker.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(router.broker.publish("", queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
+            await wait_all(
+                router.broker.publish("", queue),
+                event.wait(),
             )
 
         assert event.is_set()
@@ -76,13 +80,10 @@ class FastAPITestcase:  # noqa: D101
 
         async with router.broker:
             await router.broker.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(router.broker.publish(1, queue)),
-                    asyncio.create_task(router.broker.publish(2, queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
+            await wait_all(
+                router.broker.publish(1, queue),
+                router.broker.publish(2, queue),
+                event.wait(),
             )
 
         assert event.is_set()
@@ -104,14 +105,11 @@ class FastAPITestcase:  # noqa: D101
 
         async with router.broker:
             await router.broker.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(router.broker.publish("hi", queue)),
-                    asyncio.create_task(router.broker.publish("hi", queue + "2")),
-                    asyncio.create_task(event.wait()),
-                    asyncio.create_task(event2.wait()),
-                ),
-                timeout=3,
+            await wait_all(
+                router.broker.publish("hi", queue),
+                router.broker.publish("hi", queue + "2"),
+                event.wait(),
+                event2.wait(),
             )
 
         assert event.is_set()
@@ -135,12 +133,9 @@ class FastAPITestcase:  # noqa: D101
 
         async with router.broker:
             await router.broker.start()
-            await asyncio.wait(
-                (
-                    asyncio.create_task(router.broker.publish("", queue)),
-                    asyncio.create_task(event.wait()),
-                ),
-                timeout=3,
+            await wait_all(
+                router.broker.publish("", queue),
+                event.wait(),
             )
 
         assert event.is_set()
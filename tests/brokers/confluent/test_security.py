@@ -1,183 +1,106 @@
 import ssl
 from contextlib import contextmanager
-from typing import Tuple
-from unittest.mock import AsyncMock, MagicMock, patch
+from typing import Any, Iterator, List, Tuple, Type
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from docs.docs_src.confluent.security.basic import broker as basic_broker
+from docs.docs_src.confluent.security.plaintext import broker as plaintext_broker
+from docs.docs_src.confluent.security.sasl_scram256 import broker as scram256_broker
+from docs.docs_src.confluent.security.sasl_scram512 import broker as scram512_broker
 from docs.docs_src.confluent.security.ssl_warning import test_without_ssl_warning
+from faststream.types import AnyDict
 
 __all__ = ["test_without_ssl_warning"]
 
+_BROKER_MODULE = "faststream.confluent.broker"
 
-@contextmanager
-def patch_aio_consumer_and_producer() -> Tuple[MagicMock, MagicMock]:
-    try:
-        consumer = MagicMock(return_value=AsyncMock())
-        producer = MagicMock(return_value=AsyncMock())
-
-        # with patch("faststream.confluent.client.Consumer", new=consumer), patch(
-        #     "faststream.confluent.client.Producer", new=producer
-        # ):
-        #     yield consumer, producer
-        with patch(
-            "faststream.confluent.broker.AsyncConfluentConsumer", new=consumer
-        ), patch("faststream.confluent.broker.AsyncConfluentProducer", new=producer):
-            yield consumer, producer
-    finally:
-        pass
-
-
-@pytest.mark.asyncio()
-@pytest.mark.confluent()
-async def test_base_security():
-    with patch_aio_consumer_and_producer() as (consumer, producer):
-        from docs.docs_src.confluent.security.basic import broker as basic_broker
-
-        @basic_broker.subscriber("test")
-        async def handler():
-            ...
-
-        async with basic_broker:
-            await basic_broker.start()
 
-        consumer_call_kwargs = consumer.call_args.kwargs
-        producer_call_kwargs = producer.call_args.kwargs
+class _ClientStub:
+    """A cheap AsyncConfluent* replacement recording constructor kwargs."""
 
-        call_kwargs = {}
-        call_kwargs["security_protocol"] = "SSL"
+    calls: List[AnyDict]
 
-        assert call_kwargs.items() <= consumer_call_kwargs.items()
-        assert call_kwargs.items() <= producer_call_kwargs.items()
-
-        assert (
-            consumer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
-        assert (
-            producer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
-
-        assert type(consumer_call_kwargs["ssl_context"]) == ssl.SSLContext
-        assert type(producer_call_kwargs["ssl_context"]) == ssl.SSLContext
-
-
-@pytest.mark.asyncio()
-@pytest.mark.confluent()
-async def test_scram256():
-    with patch_aio_consumer_and_producer() as (consumer, producer):
-        from docs.docs_src.confluent.security.sasl_scram256 import (
-            broker as scram256_broker,
-        )
-
-        @scram256_broker.subscriber("test")
-        async def handler():
-            ...
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append(kwargs)
 
-        async with scram256_broker:
-            await scram256_broker.start()
+    def __getattr__(self, name: str) -> AsyncMock:
+        return AsyncMock()
 
-        consumer_call_kwargs = consumer.call_args.kwargs
-        producer_call_kwargs = producer.call_args.kwargs
 
-        call_kwargs = {}
-        call_kwargs["sasl_mechanism"] = "SCRAM-SHA-256"
-        call_kwargs["sasl_plain_username"] = "admin"
-        call_kwargs["sasl_plain_password"] = "password"  # pragma: allowlist secret
-        call_kwargs["security_protocol"] = "SASL_SSL"
-
-        assert call_kwargs.items() <= consumer_call_kwargs.items()
-        assert call_kwargs.items() <= producer_call_kwargs.items()
-
-        assert (
-            consumer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
-        assert (
-            producer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
-
-        assert type(consumer_call_kwargs["ssl_context"]) == ssl.SSLContext
-        assert type(producer_call_kwargs["ssl_context"]) == ssl.SSLContext
-
-
-@pytest.mark.asyncio()
-@pytest.mark.confluent()
-async def test_scram512():
-    with patch_aio_consumer_and_producer() as (consumer, producer):
-        from docs.docs_src.confluent.security.sasl_scram512 import (
-            broker as scram512_broker,
-        )
-
-        @scram512_broker.subscriber("test")
-        async def handler():
-            ...
-
-        async with scram512_broker:
-            await scram512_broker.start()
-
-        consumer_call_kwargs = consumer.call_args.kwargs
-        producer_call_kwargs = producer.call_args.kwargs
-
-        call_kwargs = {}
-        call_kwargs["sasl_mechanism"] = "SCRAM-SHA-512"
-        call_kwargs["sasl_plain_username"] = "admin"
-        call_kwargs["sasl_plain_password"] = "password"  # pragma: allowlist secret
-        call_kwargs["security_protocol"] = "SASL_SSL"
-
-        assert call_kwargs.items() <= consumer_call_kwargs.items()
-        assert call_kwargs.items() <= producer_call_kwargs.items()
-
-        assert (
-            consumer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
-        assert (
-            producer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
+@contextmanager
+def patch_aio_consumer_and_producer() -> (
+    Iterator[Tuple[Type[_ClientStub], Type[_ClientStub]]]
+):
+    consumer = type("ConsumerStub", (_ClientStub,), {"calls": []})
+    producer = type("ProducerStub", (_ClientStub,), {"calls": []})
 
-        assert type(consumer_call_kwargs["ssl_context"]) == ssl.SSLContext
-        assert type(producer_call_kwargs["ssl_context"]) == ssl.SSLContext
+    with patch.multiple(
+        _BROKER_MODULE,
+        AsyncConfluentConsumer=consumer,
+        AsyncConfluentProducer=producer,
+    ):
+        yield consumer, producer
 
 
 @pytest.mark.asyncio()
 @pytest.mark.confluent()
-async def test_plaintext():
+@pytest.mark.parametrize(
+    ("broker", "expected_call_kwargs"),
+    [
+        pytest.param(
+            basic_broker,
+            {"security_protocol": "SSL"},
+            id="basic",
+        ),
+        pytest.param(
+            scram256_broker,
+            {
+                "sasl_mechanism": "SCRAM-SHA-256",
+                "sasl_plain_username": "admin",
+                "sasl_plain_password": "password",  # pragma: allowlist secret
+                "security_protocol": "SASL_SSL",
+            },
+            id="scram256",
+        ),
+        pytest.param(
+            scram512_broker,
+            {
+                "sasl_mechanism": "SCRAM-SHA-512",
+                "sasl_plain_username": "admin",
+                "sasl_plain_password": "password",  # pragma: allowlist secret
+                "security_protocol": "SASL_SSL",
+            },
+            id="scram512",
+        ),
+        pytest.param(
+            plaintext_broker,
+            {
+                "sasl_mechanism": "PLAIN",
+                "sasl_plain_username": "admin",
+                "sasl_plain_password": "password",  # pragma: allowlist secret
+                "security_protocol": "SASL_SSL",
+            },
+            id="plaintext",
+        ),
+    ],
+)
+async def test_security_args(broker, expected_call_kwargs: AnyDict):
     with patch_aio_consumer_and_producer() as (consumer, producer):
-        from docs.docs_src.confluent.security.plaintext import (
-            broker as plaintext_broker,
-        )
 
-        @plaintext_broker.subscriber("test")
+        @broker.subscriber("test")
         async def handler():
             ...
 
-        async with plaintext_broker:
-            await plaintext_broker.start()
-
-        consumer_call_kwargs = consumer.call_args.kwargs
-        producer_call_kwargs = producer.call_args.kwargs
-
-        call_kwargs = {}
-        call_kwargs["sasl_mechanism"] = "PLAIN"
-        call_kwargs["sasl_plain_username"] = "admin"
-        call_kwargs["sasl_plain_password"] = "password"  # pragma: allowlist secret
-        call_kwargs["security_protocol"] = "SASL_SSL"
+        async with broker:
+            await broker.start()
 
-        assert call_kwargs.items() <= consumer_call_kwargs.items()
-        assert call_kwargs.items() <= producer_call_kwargs.items()
+        consumer_call_kwargs = consumer.calls[-1]
+        producer_call_kwargs = producer.calls[-1]
 
-        assert (
-            consumer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
-        assert (
-            producer_call_kwargs["security_protocol"]
-            == call_kwargs["security_protocol"]
-        )
+        assert expected_call_kwargs.items() <= consumer_call_kwargs.items()
+        assert expected_call_kwargs.items() <= producer_call_kwargs.items()
 
-        assert type(consumer_call_kwargs["ssl_context"]) == ssl.SSLContext
-        assert type(producer_call_kwargs["ssl_context"]) == ssl.SSLContext
+        assert isinstance(consumer_call_kwargs["ssl_context"], ssl.SSLContext)
+        assert isinstance(producer_call_kwargs["ssl_context"], ssl.SSLContext)
@@ -34,47 +34,36 @@ class TestTestclient(BrokerTestclientTestcase):
 
         assert event.is_set()
 
-    async def test_batch_pub_by_default_pub(
+    async def test_batch_pub(
         self,
         test_broker: KafkaBroker,
         queue: str,
     ):
         @test_broker.subscriber(queue, batch=True, auto_offset_reset="earliest")
-        async def m():
+        async def default_pub_handler():
             pass
 
-        await test_broker.start()
-        await test_broker.publish("hello", queue)
-        m.mock.assert_called_once_with(["hello"])
-
-    async def test_batch_pub_by_pub_batch(
-        self,
-        test_broker: KafkaBroker,
-        queue: str,
-    ):
-        @test_broker.subscriber(queue, batch=True, auto_offset_reset="earliest")
-        async def m():
+        @test_broker.subscriber(queue + "1", batch=True, auto_offset_reset="earliest")
+        async def batch_pub_handler():
             pass
 
-        await test_broker.start()
-        await test_broker.publish_batch("hello", topic=queue)
-        m.mock.assert_called_once_with(["hello"])
-
-    async def test_batch_publisher_mock(
-        self,
-        test_broker: KafkaBroker,
-        queue: str,
-    ):
-        publisher = test_broker.publisher(queue + "1", batch=True)
+        publisher = test_broker.publisher(queue + "3", batch=True)
 
         @publisher
-        @test_broker.subscriber(queue, auto_offset_reset="earliest")
-        async def m():
+        @test_broker.subscriber(queue + "2", auto_offset_reset="earliest")
+        async def publisher_handler():
             return 1, 2, 3
 
         await test_broker.start()
-        await test_broker.publish("hello", queue)
-        m.mock.assert_called_once_with("hello")
+        await asyncio.gather(
+            test_broker.publish("hello", queue),
+            test_broker.publish_batch("hello", topic=queue + "1"),
+            test_broker.publish("hello", queue + "2"),
+        )
+
+        default_pub_handler.mock.assert_called_once_with(["hello"])
+        batch_pub_handler.mock.assert_called_once_with(["hello"])
+        publisher_handler.mock.assert_called_once_with("hello")
         publisher.mock.assert_called_once_with([1, 2, 3])
 
     async def test_respect_middleware(self, queue):
@@ -97,8 +86,10 @@ class TestTestclient(BrokerTestclientTestcase):
             ...
 
         async with TestKafkaBroker(broker) as br:
-            await br.publish("", queue)
-            await br.publish("", queue + "1")
+            await asyncio.gather(
+                br.publish("", queue),
+                br.publish("", queue + "1"),
+            )
 
         assert len(routes) == 2
 
@@ -5,8 +5,29 @@ import pytest
 from typer.testing import CliRunner
 
 from faststream.__about__ import __version__
+from faststream._compat import IS_WINDOWS
 from faststream.utils import context as global_context
 
+if not IS_WINDOWS:
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+
+    class _EagerTaskFactoryPolicy(type(asyncio.get_event_loop_policy())):  # type: ignore[misc]
+        """An event loop policy installing the eager task factory on new loops."""
+
+        def new_event_loop(self) -> asyncio.AbstractEventLoop:
+            loop = super().new_event_loop()
+            loop.set_task_factory(asyncio.eager_task_factory)
+            return loop
+
+    asyncio.set_event_loop_policy(_EagerTaskFactoryPolicy())
+
 
 @pytest.hookimpl(tryfirst=True)
 def pytest_keyboard_interrupt(excinfo):  # pragma: no cover
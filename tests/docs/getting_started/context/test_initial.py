@@ -1,60 +1,34 @@
+import importlib
+
 import pytest
 
 from faststream import context
 from tests.marks import python39
 
 
-@pytest.mark.asyncio()
-@python39
-async def test_kafka():
-    from docs.docs_src.getting_started.context.kafka.initial import broker
-    from faststream.kafka import TestKafkaBroker
-
-    async with TestKafkaBroker(broker) as br:
-        await br.publish("", "test-topic")
-        await br.publish("", "test-topic")
-
-    assert context.get("collector") == ["", ""]
-    context.clear()
-
-
-@pytest.mark.asyncio()
+@pytest.mark.asyncio(scope="module")
 @python39
-async def test_rabbit():
-    from docs.docs_src.getting_started.context.rabbit.initial import broker
-    from faststream.rabbit import TestRabbitBroker
-
-    async with TestRabbitBroker(broker) as br:
-        await br.publish("", "test-queue")
-        await br.publish("", "test-queue")
-
-    assert context.get("collector") == ["", ""]
-    context.clear()
-
-
-@pytest.mark.asyncio()
-@python39
-async def test_nats():
-    from docs.docs_src.getting_started.context.nats.initial import broker
-    from faststream.nats import TestNatsBroker
-
-    async with TestNatsBroker(broker) as br:
-        await br.publish("", "test-subject")
-        await br.publish("", "test-subject")
-
-    assert context.get("collector") == ["", ""]
-    context.clear()
-
-
-@pytest.mark.asyncio()
-@python39
-async def test_redis():
-    from docs.docs_src.getting_started.context.redis.initial import broker
-    from faststream.redis import TestRedisBroker
-
-    async with TestRedisBroker(broker) as br:
-        await br.publish("", "test-channel")
-        await br.publish("", "test-channel")
+@pytest.mark.parametrize(
+    ("pkg", "broker_cls_name", "subject"),
+    [
+        pytest.param("kafka", "TestKafkaBroker", "test-topic", id="kafka"),
+        pytest.param("rabbit", "TestRabbitBroker", "test-queue", id="rabbit"),
+        pytest.param("nats", "TestNatsBroker", "test-subject", id="nats"),
+        pytest.param("redis", "TestRedisBroker", "test-channel", id="redis"),
+    ],
+)
+async def test_initial(pkg: str, broker_cls_name: str, subject: str):
+    broker_module = importlib.import_module(
+        f"docs.docs_src.getting_started.context.{pkg}.initial"
+    )
+    test_broker_cls = getattr(
+        importlib.import_module(f"faststream.{pkg}"),
+        broker_cls_name,
+    )
+
+    async with test_broker_cls(broker_module.broker) as br:
+        await br.publish("", subject)
+        await br.publish("", subject)
 
     assert context.get("collector") == ["", ""]
     context.clear()
@@ -1,8 +1,14 @@
+import asyncio
 from contextlib import contextmanager
-from typing import Any, Iterable
+from typing import Any, Awaitable, Iterable
 from unittest.mock import MagicMock
 
 
+async def wait_all(*coros: Awaitable[Any], timeout: float = 3) -> None:
+    """Await the coroutines together, cancelling the rest on error or timeout."""
+    await asyncio.wait_for(asyncio.gather(*coros), timeout=timeout)
+
+
 def spy_decorator(method):
     mock = MagicMock()
 